@@ -57,16 +57,52 @@ class TestUuid25(unittest.TestCase):
         self.assertNotIn(G, s)
         self.assertIn(Uuid25.parse(G), s)
 
+    def test_pickle(self) -> None:
+        """Tests if instances survive a pickle round trip."""
+        import pickle
+
+        for e in TEST_CASES:
+            x = Uuid25.parse(e.hex)
+            x.to_urn()  # populate derived caches before pickling
+            y = pickle.loads(pickle.dumps(x))
+            self.assertEqual(x, y)
+            self.assertEqual(hash(x), hash(y))
+            self.assertEqual(hash(e.uuid25), hash(y))
+            self.assertEqual(y.to_bytes(), e.bytes)
+            self.assertEqual(y.to_urn(), e.urn)
+
+            # only the canonical string is serialized
+            self.assertEqual(x.__reduce__(), (Uuid25, (e.uuid25,)))
+            payload = pickle.dumps(x)
+            self.assertIn(e.uuid25.encode(), payload)
+            self.assertNotIn(b"_int", payload)
+            self.assertNotIn(b"_hex", payload)
+            self.assertNotIn(b"_hyphenated", payload)
+
+        # pickles written by 0.1.3 (protocols 2 and 4)
+        legacy = [
+            b"\x80\x02cuuid25\nUuid25\nq\x00)\x81q\x01N}q\x02X\x05\x00\x00\x00valueq"
+            b"\x03X\x19\x00\x00\x00dpoadk8izg9y4tte7vy1xt94oq\x04s\x86q\x05b.",
+            b"\x80\x04\x95C\x00\x00\x00\x00\x00\x00\x00\x8c\x06uuid25\x94\x8c\x06Uuid25"
+            b"\x94\x93\x94)\x81\x94N}\x94\x8c\x05value\x94\x8c\x19dpoadk8izg9y4tte7vy1xt94o"
+            b"\x94s\x86\x94b.",
+        ]
+        for data in legacy:
+            z = pickle.loads(data)
+            self.assertIs(type(z), Uuid25)
+            self.assertEqual(z.value, "dpoadk8izg9y4tte7vy1xt94o")
+            self.assertEqual(z.to_hex(), "e7a1d63b711744238988afcf12161878")
+            self.assertEqual(
+                z.to_urn(), "urn:uuid:e7a1d63b-7117-4423-8988-afcf12161878"
+            )
+
     def test_from_to_prepared_bytes(self) -> None:
         """Tests conversions from/to byte arrays using manually prepared cases."""
         for e in TEST_CASES:
             x = Uuid25.parse(e.uuid25)
             self.assertEqual(x.value, Uuid25.from_bytes(e.bytes).value)
 
-            bs = x.to_bytes()
-            self.assertEqual(len(bs), len(e.bytes))
-            for i in range(len(bs)):
-                self.assertEqual(bs[i], e.bytes[i])
+            self.assertEqual(x.to_bytes(), e.bytes)
 
     def test_parse(self) -> None:
         """Examines parsing results against manually prepared cases."""
@@ -83,6 +119,8 @@ class TestUuid25(unittest.TestCase):
             self.assertEqual(x, Uuid25.parse_hyphenated(e.hyphenated).value)
             self.assertEqual(x, Uuid25.parse_braced(e.braced).value)
             self.assertEqual(x, Uuid25.parse_urn(e.urn).value)
+            self.assertEqual(x, Uuid25(e.uuid25).value)
+            self.assertEqual(x, Uuid25(e.uuid25.upper()).value)
 
             self.assertRaises(ParseError, lambda: Uuid25.parse_uuid25(e.hex))
             self.assertRaises(ParseError, lambda: Uuid25.parse_uuid25(e.hyphenated))
@@ -126,6 +164,14 @@ class TestUuid25(unittest.TestCase):
             self.assertEqual(x.to_braced(), e.braced)
             self.assertEqual(x.to_urn(), e.urn)
 
+            # repeated and reordered calls return the same results
+            y = Uuid25.parse(e.hex)
+            self.assertEqual(y.to_urn(), e.urn)
+            self.assertEqual(y.to_braced(), e.braced)
+            self.assertEqual(y.to_hyphenated(), e.hyphenated)
+            self.assertEqual(y.to_hex(), e.hex)
+            self.assertEqual(y.to_urn(), e.urn)
+
     def test_parse_error(self) -> None:
         """Tests if parsing methods raise error on invalid inputs."""
         cases = [
@@ -148,11 +194,19 @@ class TestUuid25(unittest.TestCase):
             "82f1dd3c-de95-075b93ff-a240-f135f8fd",
             "{8273b64c5ed0a88b10dad09a6a2b963c}",
             "urn:uuid:8273b64c5ed0a88b10dad09a6a2b963c",
+            "+8273b64c5ed0a88b10dad09a6a2b96c",
+            "8273b64c_5ed0a88b10dad09a6a2b96c",
+            "82f1dd3c-de95-075b-93ff-a240f1_5f8fd",
+            "{82f1dd3c-de95-075b-93ff-a240f135f8fd ",
+            "urn:uuid:82f1dd3c-de95-075b-93ff-a240f1 5f8fd",
+            "82f1dd3c-de95-075b-93ff-a240f135-8fd",
+            "{82f1dd3c-de95-075b-93ff-a240-135f8fd}",
         ]
 
         for e in cases:
             self.assertRaises(ParseError, lambda: Uuid25.parse(e))
             self.assertRaises(ParseError, lambda: Uuid25.parse_uuid25(e))
+            self.assertRaises(ParseError, lambda: Uuid25(e))
             self.assertRaises(ParseError, lambda: Uuid25.parse_hex(e))
             self.assertRaises(ParseError, lambda: Uuid25.parse_hyphenated(e))
             self.assertRaises(ParseError, lambda: Uuid25.parse_braced(e))
@@ -170,6 +224,20 @@ class TestUuid25(unittest.TestCase):
             self.assertEqual(x, y)
             self.assertEqual(Uuid25.from_uuid(x).value, e.uuid25)
 
+    def test_gen_v4(self) -> None:
+        """Tests if `gen_v4()` generates distinct UUIDv4 values."""
+        import uuid
+
+        from uuid25 import gen_v4
+
+        xs = [gen_v4() for _ in range(1000)]
+        self.assertEqual(len(set(xs)), len(xs))
+        for x in xs:
+            self.assertEqual(len(x.value), 25)
+            y = x.to_uuid()
+            self.assertEqual(y.version, 4)
+            self.assertEqual(y.variant, uuid.RFC_4122)
+
 
 class PreparedCase(typing.NamedTuple):
     uuid25: str
@@ -41,7 +41,7 @@ e = Uuid25.from_uuid(uuid_module)
 assert e.value == "ef1zh7jc64vprqez41vbwe9km"
 assert e.to_uuid() == uuid_module
 
-# generate UUIDv4 in Uuid25 format (backed by uuid module)
+# generate UUIDv4 in Uuid25 format (backed by os.urandom())
 import uuid25
 
 print(uuid25.gen_v4())  # e.g., "99wfqtl0z0yevxzpl4hv2dm5p"
@@ -52,9 +52,27 @@ from __future__ import annotations
 
 __all__ = ["Uuid25", "ParseError", "gen_v4"]
 
-import re
+import os
 import uuid
 
+# Deletion tables used to check that a string consists only of allowed characters
+_UUID25_DEL = str.maketrans(
+    "", "", "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+_HEX_DEL = str.maketrans("", "", "0123456789abcdefABCDEF")
+
+# Base36 digit characters indexed by digit value
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# Two-digit Base36 strings indexed by values from 0 to 36^2 - 1
+_DIGIT_PAIRS = [x + y for x in _DIGITS for y in _DIGITS]
+
+# Largest 128-bit unsigned integer, the value of the Max UUID
+_MAX_UINT128 = (1 << 128) - 1
+
+# Default message of `ParseError`
+_PARSE_ERROR_MESSAGE = "could not parse a UUID string"
+
 
 class Uuid25:
     """The primary value type containing the Uuid25 representation of a UUID.
@@ -62,8 +80,13 @@ class Uuid25:
     This class wraps a string value to provide conversion methods from/to other popular
     UUID textual representations.
 
-    Create an instance of this class using one of "conversion-from" class methods. It is
-    strongly discouraged to create an instance directly with the constructor.
+    Create an instance of this class using one of "conversion-from" class methods. The
+    constructor is equivalent to `parse_uuid25()`: it accepts the 25-digit Base36 Uuid25
+    format only and raises `ParseError` on any other input.
+
+    The other "conversion-from" class methods build instances without calling
+    `__init__()`, so subclasses cannot rely on an overridden `__init__()` to initialize
+    instances created by them.
 
     Attributes:
         value:
@@ -72,11 +95,49 @@ class Uuid25:
     """
 
     value: str
+    _int: int
+    _hex: str | None
+    _hyphenated: str | None
 
-    __slots__ = "value"
+    __slots__ = ("value", "_int", "_hex", "_hyphenated")
 
     def __init__(self, uuid25_string: str) -> None:
+        """Creates an instance from the 25-digit Base36 Uuid25 format, accepting the
+        same input as `parse_uuid25()`.
+
+        Raises:
+            `ParseError` if the argument is not in the 25-digit Base36 format.
+        """
+        s = uuid25_string
+        if len(s) == 25 and not s.translate(_UUID25_DEL):
+            uint128 = int(s, 36)
+            if uint128 <= _MAX_UINT128:
+                self._set_parts(s.lower(), uint128)
+                return
+        raise ParseError(_PARSE_ERROR_MESSAGE)
+
+    def _set_parts(self, uuid25_string: str, uint128: int) -> None:
+        """Initializes the slots from a Uuid25 string and its 128-bit integer value."""
         self.value = uuid25_string
+        self._int = uint128
+        self._hex = None
+        self._hyphenated = None
+
+    @classmethod
+    def _from_parts(cls, uuid25_string: str, uint128: int) -> Uuid25:
+        """Creates an instance from a Uuid25 string and its 128-bit integer value."""
+        obj = cls.__new__(cls)
+        obj._set_parts(uuid25_string, uint128)
+        return obj
+
+    def __reduce__(self) -> tuple[type[Uuid25], tuple[str]]:
+        # Pickle only the canonical string; the derived slots are rebuilt on load
+        return (self.__class__, (self.value,))
+
+    def __setstate__(self, state: tuple[None, dict[str, str]]) -> None:
+        # Loads pickles written by 0.1.3, which stored `value` as the only slot state
+        value = state[1]["value"]
+        self._set_parts(value, int(value, 36))
 
     def __repr__(self) -> str:
         return f'{self.__class__.__qualname__}("{self.value}")'
@@ -85,7 +146,9 @@ class Uuid25:
         return self.value
 
     def __eq__(self, other: object) -> bool:
-        if type(other) is str:
+        if self is other:
+            return True
+        elif type(other) is str:
             return self.value == other
         elif isinstance(other, self.__class__):
             return self.value == other.value
@@ -125,15 +188,19 @@ class Uuid25:
     @classmethod
     def _from_int(cls, uint128: int) -> Uuid25:
         """Creates an instance from a 128-bit unsigned integer."""
-        if not 0 <= uint128 < 1 << 128:
+        if not 0 <= uint128 <= _MAX_UINT128:
             raise AssertionError("invalid int value")
 
-        digits = "0123456789abcdefghijklmnopqrstuvwxyz"
-        buffer = ["0"] * 25
-        for i in reversed(range(25)):
-            (uint128, rem) = divmod(uint128, 36)
-            buffer[i] = digits[rem]
-        return cls("".join(buffer))
+        # Emit two digits per division using the table of digit pairs; the leading
+        # digit left after 12 divisions is always less than 36 as 2^128 < 36^25
+        n = uint128
+        pairs = []
+        for _ in range(12):
+            (n, rem) = divmod(n, 1296)
+            pairs.append(_DIGIT_PAIRS[rem])
+        pairs.append(_DIGITS[n])
+        pairs.reverse()
+        return cls._from_parts("".join(pairs), uint128)
 
     @classmethod
     def from_bytes(cls, uuid_bytes: bytes) -> Uuid25:
@@ -148,7 +215,7 @@ class Uuid25:
 
     def to_bytes(self) -> bytes:
         """Converts `self` into the 16-byte binary representation of a UUID."""
-        return int(self.value, 36).to_bytes(16, "big")
+        return self._int.to_bytes(16, "big")
 
     @classmethod
     def parse(cls, uuid_string: str) -> Uuid25:
@@ -178,7 +245,7 @@ class Uuid25:
             return cls.parse_braced(uuid_string)
         elif length == 45:
             return cls.parse_urn(uuid_string)
-        raise ParseError._with_default_message()
+        raise ParseError(_PARSE_ERROR_MESSAGE)
 
     @classmethod
     def parse_uuid25(cls, uuid_string: str) -> Uuid25:
@@ -188,11 +255,7 @@ class Uuid25:
         Raises:
             `ParseError` if the argument is not in the specified format.
         """
-        if re.fullmatch(r"[0-9a-z]{25}", uuid_string, flags=re.I):
-            value = uuid_string.lower()
-            if value <= "f5lxx1zz5pnorynqglhzmsp33":  # 2^128 - 1
-                return cls(value)
-        raise ParseError._with_default_message()
+        return cls(uuid_string)
 
     @classmethod
     def parse_hex(cls, uuid_string: str) -> Uuid25:
@@ -202,9 +265,9 @@ class Uuid25:
         Raises:
             `ParseError` if the argument is not in the specified format.
         """
-        if re.fullmatch(r"[0-9a-f]{32}", uuid_string, flags=re.I):
+        if len(uuid_string) == 32 and not uuid_string.translate(_HEX_DEL):
             return cls._from_int(int(uuid_string, 16))
-        raise ParseError._with_default_message()
+        raise ParseError(_PARSE_ERROR_MESSAGE)
 
     @classmethod
     def parse_hyphenated(cls, uuid_string: str) -> Uuid25:
@@ -214,14 +277,9 @@ class Uuid25:
         Raises:
             `ParseError` if the argument is not in the specified format.
         """
-        m = re.fullmatch(
-            r"([0-9a-f]{8})-([0-9a-f]{4})-([0-9a-f]{4})-([0-9a-f]{4})-([0-9a-f]{12})",
-            uuid_string,
-            flags=re.I,
-        )
-        if m:
-            return cls._from_int(int("".join(m.groups()), 16))
-        raise ParseError._with_default_message()
+        if len(uuid_string) == 36:
+            return cls._from_int(_parse_hyphenated_hex(uuid_string, 0))
+        raise ParseError(_PARSE_ERROR_MESSAGE)
 
     @classmethod
     def parse_braced(cls, uuid_string: str) -> Uuid25:
@@ -231,14 +289,9 @@ class Uuid25:
         Raises:
             `ParseError` if the argument is not in the specified format.
         """
-        m = re.fullmatch(
-            r"\{([0-9a-f]{8})-([0-9a-f]{4})-([0-9a-f]{4})-([0-9a-f]{4})-([0-9a-f]{12})\}",
-            uuid_string,
-            flags=re.I,
-        )
-        if m:
-            return cls._from_int(int("".join(m.groups()), 16))
-        raise ParseError._with_default_message()
+        if len(uuid_string) == 38 and uuid_string[0] == "{" and uuid_string[37] == "}":
+            return cls._from_int(_parse_hyphenated_hex(uuid_string, 1))
+        raise ParseError(_PARSE_ERROR_MESSAGE)
 
     @classmethod
     def parse_urn(cls, uuid_string: str) -> Uuid25:
@@ -248,45 +301,40 @@ class Uuid25:
         Raises:
             `ParseError` if the argument is not in the specified format.
         """
-        m = re.fullmatch(
-            r"urn:uuid:([0-9a-f]{8})-([0-9a-f]{4})-([0-9a-f]{4})-([0-9a-f]{4})-([0-9a-f]{12})",
-            uuid_string,
-            flags=re.I,
-        )
-        if m:
-            return cls._from_int(int("".join(m.groups()), 16))
-        raise ParseError._with_default_message()
+        if len(uuid_string) == 45 and uuid_string[:9].lower() == "urn:uuid:":
+            return cls._from_int(_parse_hyphenated_hex(uuid_string, 9))
+        raise ParseError(_PARSE_ERROR_MESSAGE)
 
     def to_hex(self) -> str:
         """Formats `self` in the 32-digit hexadecimal format without hyphens:
         `40eb9860cf3e45e2a90eb82236ac806c`.
         """
-        return f"{int(self.value, 36):032x}"
+        h = self._hex
+        if h is None:
+            h = self._hex = self._int.to_bytes(16, "big").hex()
+        return h
 
     def to_hyphenated(self) -> str:
         """Formats `self` in the 8-4-4-4-12 hyphenated format:
         `40eb9860-cf3e-45e2-a90e-b82236ac806c`.
         """
-        uint128 = int(self.value, 36)
-        return "{:08x}-{:04x}-{:04x}-{:04x}-{:012x}".format(
-            uint128 >> 96,
-            (uint128 >> 80) & 0xFFFF,
-            (uint128 >> 64) & 0xFFFF,
-            (uint128 >> 48) & 0xFFFF,
-            uint128 & 0xFFFF_FFFF_FFFF,
-        )
+        s = self._hyphenated
+        if s is None:
+            h = self.to_hex()
+            s = self._hyphenated = f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+        return s
 
     def to_braced(self) -> str:
         """Formats `self` in the hyphenated format with surrounding braces:
         `{40eb9860-cf3e-45e2-a90e-b82236ac806c}`.
         """
-        return "{" + self.to_hyphenated() + "}"
+        return f"{{{self.to_hyphenated()}}}"
 
     def to_urn(self) -> str:
         """Formats `self` in the RFC 4122 URN format:
         `urn:uuid:40eb9860-cf3e-45e2-a90e-b82236ac806c`.
         """
-        return "urn:uuid:" + self.to_hyphenated()
+        return f"urn:uuid:{self.to_hyphenated()}"
 
     @classmethod
     def from_uuid(cls, uuid_object: uuid.UUID) -> Uuid25:
@@ -295,22 +343,38 @@ class Uuid25:
 
     def to_uuid(self) -> uuid.UUID:
         """Converts `self` into the standard `uuid` module's UUID object."""
-        return uuid.UUID(int=int(self.value, 36))
+        return uuid.UUID(int=self._int)
 
 
 class ParseError(ValueError):
     """An error parsing a UUID string representation."""
 
-    @classmethod
-    def _with_default_message(cls) -> ParseError:
-        """Creates an instance with the default error message."""
-        return cls("could not parse a UUID string")
+
+def _parse_hyphenated_hex(s: str, off: int) -> int:
+    """Extracts the integer value from the 8-4-4-4-12 hyphenated format that starts
+    at index `off` of `s`.
+
+    The caller is responsible for checking the length and any surrounding characters.
+
+    Raises:
+        `ParseError` if the hyphens or hexadecimal digits are malformed.
+    """
+    if s[off + 8] == s[off + 13] == s[off + 18] == s[off + 23] == "-":
+        # A hyphen elsewhere would shorten the result below 32 digits
+        hex_digits = s[off : off + 36].replace("-", "")
+        if len(hex_digits) == 32 and not hex_digits.translate(_HEX_DEL):
+            return int(hex_digits, 16)
+    raise ParseError(_PARSE_ERROR_MESSAGE)
 
 
 def gen_v4() -> Uuid25:
     """Generates a random UUID (UUIDv4) value encoded in the Uuid25 format.
 
-    This function calls the standard `uuid` module's `uuid4()` function and converts the
-    result into a Uuid25 instance.
+    This function reads 16 random bytes from `os.urandom()`, the same source the
+    standard `uuid` module's `uuid4()` function uses, sets the version and variant
+    bits, and converts the result into a Uuid25 instance.
     """
-    return Uuid25.from_uuid(uuid.uuid4())
+    uuid_bytes = bytearray(os.urandom(16))
+    uuid_bytes[6] = 0x40 | (uuid_bytes[6] & 0x0F)  # version 4
+    uuid_bytes[8] = 0x80 | (uuid_bytes[8] & 0x3F)  # RFC 4122 variant
+    return Uuid25.from_bytes(bytes(uuid_bytes))